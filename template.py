@@ -5,21 +5,98 @@ in python.
 
 Classes:
 ---
-Resume: extends UserDict and provides methods for creating and managing the
+Resume: extends dict and provides methods for creating and managing the
         resume object
 """
 
 import collections
+import copy
 import datetime
 import json
+import mmap
+import os
+import re
+import shutil
+import stat
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class Resume(collections.UserDict):
+# Number of bytes open_from_file asks for once a file's reported size has been
+# read, or straight away for pipes and the like, which report a size of 0
+_READ_SIZE = 1 << 16
+
+# Regular files larger than this many bytes are memory-mapped rather than read
+# when orjson is available, as below it the cost of setting up the map
+# dominates
+_MMAP_THRESHOLD = 64 * 1024
+
+# Patterns used by iter_from_file to find where each resume in a file ends.
+# They operate on the raw bytes, which is safe because no byte of a multibyte
+# UTF-8 sequence falls in the ASCII range they match. _SKIP consumes
+# everything up to the next bracket, including any complete strings, so that
+# the scan only stops at brackets or at a string cut off by the batch's end.
+_NON_WHITESPACE = re.compile(rb'[^ \t\n\r]')
+_SKIP = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+
+def _loads(raw):
+    """Decodes the json in raw, using orjson when it is installed"""
+
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_default(obj):
+    """Encodes the objects json does not support, namely dates, for _dumps"""
+
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} "
+                    f"is not JSON serializable")
+
+
+# Encoder used when orjson is not installed. It is created once instead of on
+# every call, and matches orjson's compact separators. Non-ASCII characters
+# are still escaped, so that strings holding lone surrogates, which cannot be
+# encoded as UTF-8, round-trip as they did before
+_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+
+
+def _dumps(obj) -> bytes:
+    """Encodes obj as json, using orjson when it is installed
+
+    Dates are encoded as isoformat strings.
+    """
+
+    if orjson:
+        return orjson.dumps(obj)
+    return _ENCODER.encode(obj).encode()
+
+
+def _intern(value):
+    """Returns the interned copy of value if it is a string, otherwise value
+
+    Used for values drawn from a small set (country codes, fluency levels), so
+    that every entry holding the same value shares a single string object.
+    """
+
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+class Resume(dict):
     """Represents a json resume in python and provides methods for management
 
-    This class extends functionality of UserDict. UserDict's __init__ is called 
-    and used to set the initial value of the data variable. Additional methods 
-    are provided which allow for easier manipulation of the resume's contents.
+    This class extends functionality of dict, holding the resume's contents
+    directly so that item access goes straight to the C implementation.
+    Additional methods are provided which allow for easier manipulation of the
+    resume's contents.
 
     Methods:
     ---
@@ -33,6 +110,9 @@ class Resume(collections.UserDict):
     add_skill
     add_volunteer
     add_work
+    add_work_bulk
+    copy
+    iter_from_file
     open_from_file
     remove_award
     remove_education
@@ -58,19 +138,22 @@ class Resume(collections.UserDict):
 
     Variables:
     ---
-    categories - list of top-level categories in a json resume
-    data - dict inherited from UserDict
+    categories - tuple of top-level categories in a json resume
+    data - the Resume itself, kept for code written against UserDict
     location - string containing the url to open from/save to
     """
 
-    def __init__(self, location: str="", basics: dict={}, work: list=[],
-                 volunteer: list=[], education: list=[], awards: list=[],
-                 publications: list=[], skills: list=[], languages: list=[],
-                 interests: list=[], references: list=[]) -> None:
+    __slots__ = ("location",)
+
+    def __init__(self, location: str="", basics: dict=None, work: list=None,
+                 volunteer: list=None, education: list=None,
+                 awards: list=None, publications: list=None,
+                 skills: list=None, languages: list=None,
+                 interests: list=None, references: list=None) -> None:
         """Constructor for the Resume class
 
-        Calls UserDict's __init__ to set the values of the data attribute and 
-        sets the location variable. The data stored represents the contents of
+        Calls dict's __init__ to set the contents of the resume and sets the
+        location variable. The data stored represents the contents of
         a json resume.
 
         Return: None
@@ -90,689 +173,575 @@ class Resume(collections.UserDict):
         references - optional list containing a dict for each reference
         """
 
-        super().__init__({'basics': basics,
-                          'work': work, 
-                          'volunteer': volunteer,
-                          'education': education, 
-                          'awards': awards,
-                          'publications': publications, 
-                          'skills': skills,
-                          'languages': languages, 
-                          'interests': interests,
-                          'references': references})
+        # Fresh containers for every instance, rather than shared defaults
+        basics = {} if basics is None else basics
+        work = [] if work is None else work
+        volunteer = [] if volunteer is None else volunteer
+        education = [] if education is None else education
+        awards = [] if awards is None else awards
+        publications = [] if publications is None else publications
+        skills = [] if skills is None else skills
+        languages = [] if languages is None else languages
+        interests = [] if interests is None else interests
+        references = [] if references is None else references
+
+        super().__init__(basics=basics,
+                         work=work,
+                         volunteer=volunteer,
+                         education=education,
+                         awards=awards,
+                         publications=publications,
+                         skills=skills,
+                         languages=languages,
+                         interests=interests,
+                         references=references)
         self.location = location
 
-    categories = ["basics", "work", "volunteer", "education", "awards",
-                  "publications", "skills", "languages", "interests",
-                  "references"]
-    
-    # File I/O
-    def open_from_file(self, location: str) -> None:
-        """Fills in the Resume instance using the specified json resume
+    def __reduce__(self):
+        """Supports pickling and copying of Resume instances
 
-        Returns: None
-
-        Arguments:
-        ---
-        location - string containing the url from which to open
-        """
-
-        with open(location, 'r') as res:
-            resume = json.load(res)
-
-        self.data.update(resume)
-
-        self.location = location
+        The instance is rebuilt through the constructor, so that its location
+        is set before the stored categories are restored over the defaults.
 
-    def save(self) -> None:
-        """Writes the Resume instance to a json file
-
-        Returns: None
+        Returns: tuple as described by the pickle protocol
         Arguments: None
         """
 
-        with open(self.location, 'w') as out:
-            out.write(json.JSONEncoder().encode(self.data))
+        return (type(self), (self.location,), None, None, iter(self.items()))
 
+    def __or__(self, other):
+        """Returns a copy of the Resume updated with other, as dict's | does
 
-    # Basics section
-    def update_basics(self, name: str, label: str, picture: str, email: str,
-                      phone: str, website: str, summary: str) -> None:
-        """Updates the basic information
-
-        Updates all of the resume's basic information, with the exception of 
-        location and social media profiles
-
-        Returns: None
+        Returns: Resume
 
         Arguments:
         ---
-        name - string containing the applicant's name
-        label - string containing the applicant's title
-        picture string containing the location of the applicant's photo
-        email - string containing the applicant's email address
-        phone - string containing the applicant's phone number
-        website - string containing the url of the applicant's website
-        summary - string containing a description of the applicant
-        """
-
-        self["basics"].update({"name": name,
-                               "label": label,
-                               "picture": picture,
-                               "email": email,
-                               "phone": phone,
-                               "website": website,
-                               "summary": summary})
-
-    def update_location(self, address: str, postal_code: str, city: str,
-                        country_code: str, region: str) -> None:
-        """Updates the location information
-
-        Returns: None
-
-        Arguments:
-        ---
-        address - string containing the street address
-        postal_code - string containing the postal/zip code
-        city - string containing the city name
-        country_code - string containing the country code (ex: 'US')
-        region - string containing the name of the region or state
+        other - mapping whose items are merged into the copy
         """
 
-        self["basics"]["location"].update({"address": address,
-                                           "postalCode": postal_code,
-                                           "city": city,
-                                           "countryCode": country_code,
-                                           "region": region})
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
 
-    def add_profile(self, network: str, username: str, url: str) -> None:
-        """Adds a new entry to the profile list
-        
-        Returns: None
+    def copy(self):
+        """Returns a shallow copy of the Resume, keeping its location
 
-        Arguments:
-        ---
-        network - string containing the name of the social network
-        username - string containing the username
-        url - string containing the network's url
-        """
-
-        self["basics"]["profiles"].append({"network": network,
-                                           "username": username,
-                                           "url": url})
-
-    def remove_profile(self, index: int) -> None:
-        """Removes the specified profile entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which profile entry is to be removed
-        """
-
-        del self["basics"]["profiles"][index]
-
-    def update_profile(self, index: int, network: str,
-                       username: str, url: str) -> None:
-        """Updates the specified profile entry
-        
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which profile entry is to be updated
-        network - string containing the name of the social network
-        username - string containing the username
-        url - string containing the network's url
-        """
-        self["basics"]["profiles"][index].update({"network": network,
-                                                  "username": username,
-                                                  "url": url})
-
-
-    # Work section
-    def add_work(self, company: str, position: str, website: str,
-                 summary: str, highlights: list, start_date: datetime.date,
-                 end_date: datetime.date=None) -> None:
-        """Adds a new entry to the work list
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        company - string containing the name of the company worked for
-        position - string containing the title of the position worked
-        website - string containing the url of the company's website
-        summary - string containing a summary of the position
-        highlights - list containing highlighted points from the position
-        start_date - date that the position began
-        end_date - optional date that the position ended
-        """
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["work"].append({"company": company,
-                             "position": position,
-                             "website": website,
-                             "startDate": start_date.isoformat(),
-                             "endDate": end_date,
-                             "summary": summary,
-                             "highlights": highlights})
-
-    def remove_work(self, index: int) -> None:
-        """Removes the specified work entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which work entry is to be removed
-        """
-
-        del self["work"][index]
-
-    def update_work(self, index: int, company: str, position: str,
-                    website: str, summary: str, highlights: list,
-                    start_date: datetime.date, end_date: datetime.date=None) -> None:
-        """Updates the specified work entry
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which work entry is to be updated
-        company - string containing the name of the company worked for
-        position - string containing the title of the position worked
-        website - string containing the url of the company's website
-        summary - string containing a summary of the position
-        highlights - list containing highlighted points from the position
-        start_date - date that the position began
-        end_date - optional date that the position ended
-        """
-
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["work"][index].update({"company": company,
-                                    "position": position,
-                                    "website": website,
-                                    "startDate": start_date.isoformat(),
-                                    "endDate": end_date,
-                                    "summary": summary,
-                                    "highlights": highlights})
-
-
-    # Volunteer section
-    def add_volunteer(self, organization: str, position: str, website: str,
-                      summary: str, highlights: list,
-                      start_date: datetime.date, 
-                      end_date: datetime.date=None) -> None:
-        """Adds a new entry to the volunteer list
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        organization - string containing the name of the organization
-        position - string containing the name of the volunteer position
-        website - string containing the url of the organization
-        summary - string containing a summary of the volunteer work
-        highlights - list containing highlighted points from the position
-        start_date - date the volunteer work began
-        end_date - optional date the volunteer work ended
-        """
-
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["volunteer"].append({"organization": organization,
-                                  "position": position,
-                                  "website": website,
-                                  "startDate": start_date.isoformat(),
-                                  "endDate": end_date,
-                                  "summary": summary,
-                                  "highlights": highlights})
-
-    def remove_volunteer(self, index: int) -> None:
-        """Removes the specified volunteer entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which volunteer entry is to be removed
-        """
-
-        del self["volunteer"][index]
-
-    def update_volunteer(self, index: int, organization: str, position: str,
-                         website: str, summary: str, highlights: list,
-                         start_date: datetime.date,
-                         end_date: datetime.date=None) -> None:
-        """Updates the specified volunteer entry
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which volunteer entry is to be updated
-        organization - string containing the name of the organization
-        position - string containing the name of the volunteer position
-        website - string containing the url of the organization
-        summary - string containing a summary of the volunteer work
-        highlights - list containing highlighted points from the position
-        start_date - date the volunteer work began
-        end_date - optional date the volunteer work ended
-        """
+        dict's copy would return a plain dict, as UserDict's did not.
 
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["volunteer"][index].update({"organization": organization,
-                                         "position": position,
-                                         "website": website,
-                                         "startDate": start_date.isoformat(),
-                                         "endDate": end_date,
-                                         "summary": summary,
-                                         "highlights": highlights})
-
-
-    # Education section
-    def add_education(self, institution: str, area: str, study_type: str,
-                      gpa: str, courses: list, start_date: datetime.date,
-                      end_date: datetime.date=None) -> None:
-        """Adds a new entry to the education list
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        institution - string containing the name of the institution attended
-        area - string containing the area studied
-        study_type - string containing the level at which the area was studied
-        gpa - string containing the current or graduating gpa
-        courses - list containing relevant courses taken
-        start_date - date the education began
-        end_date - optional date the education was completed
-        """
-
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["education"].append({"institution": institution,
-                                  "area": area,
-                                  "studyType": study_type,
-                                  "gpa": gpa,
-                                  "startDate": start_date.isoformat(),
-                                  "endDate": end_date,
-                                  "courses": courses})
-
-    def remove_education(self, index: int) -> None:
-        """Removes the specified education entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which education entry is to be removed
-        """
-        del self["education"][index]
-
-    def update_education(self, index: int, institution: str, area: str,
-                         study_type: str, gpa: str, courses: list,
-                         start_date: datetime.date,
-                         end_date: datetime.date=None) -> None:
-        """Update the specified education entry
-
-        Note about the dates: dates are converted to isoformat strings before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which education entry is to be removed
-        institution - string containing the name of the institution attended
-        area - string containing the area studied
-        study_type - string containing the level at which the area was studied
-        gpa - string containing the current or graduating gpa
-        courses - list containing relevant courses taken
-        start_date - date the education began
-        end_date - optional date the education was completed
-        """
-
-        if end_date:
-            end_date = end_date.isoformat()
-
-        self["education"][index].update({"institution": institution,
-                                         "area": area,
-                                         "studyType": study_type,
-                                         "gpa": gpa,
-                                         "startDate": start_date.isoformat(),
-                                         "endDate": end_date,
-                                         "courses": courses})
-
-
-    # Award section
-    def add_award(self, title: str, date: datetime.date, awarder: str,
-                  summary: str) -> None:
-        """Adds a new entry to the awards list
-        
-        Note about the date: the date is converted to an isoformat string before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        title - string containing the title of the award
-        date - date the award was received
-        awarder - string containing the giver of the award
-        summary - string containing a description of the award
-        """
-
-        self["awards"].append({"title": title,
-                               "date": date.isoformat(),
-                               "awarder": awarder,
-                               "summary": summary})
-
-    def remove_award(self, index: int) -> None:
-        """Removes the specified award entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which award entry is to be removed
-        """
-
-        del self["awards"][index]
-
-    def update_award(self, index: int, title: str, date: datetime.date, awarder: str,
-                     summary: str) -> None:
-        """Updates the specified award entry
-        
-        Note about the date: the date is converted to an isoformat string before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which award entry is to be updated
-        title - string containing the title of the award
-        date - date the award was received
-        awarder - string containing the giver of the award
-        summary - string containing a description of the award
-        """
-
-        self["awards"][index].update({"title": title,
-                                      "date": date.isoformat(),
-                                      "awarder": awarder,
-                                      "summary": summary})
-
-
-    # Publication section
-    def add_publication(self, name: str, publisher: str,
-                        release_date: datetime.date, website: str,
-                        summary: str) -> None:
-        """Adds a new entry to the publications list
-
-        Note about the date: the date is converted to an isoformat string before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        name - string containing the name of the published work
-        publisher - string containing the name of the publisher
-        release_date - date the publication was released
-        website - string containing the url for the publication's website
-        summary - string containing a description of the published work
+        Returns: Resume
+        Arguments: None
         """
 
-        self["publications"].append({"name": name,
-                                     "publisher": publisher,
-                                     "releaseDate": release_date.isoformat(),
-                                     "website": website,
-                                     "summary": summary})
+        return copy.copy(self)
 
-    def remove_publication(self, index: int) -> None:
-        """Removes the specified publication entry
-
-        Returns: None
+    @property
+    def data(self) -> dict:
+        """The contents of the resume, which is the Resume itself
 
-        Arguments:
-        ---
-        index - integer indicating which publication entry is to be removed
+        Assigning a dict replaces the contents of the resume with it.
         """
-        del self["publications"][index]
-
-    def update_publication(self, index: int, name: str, publisher: str,
-                        release_date: datetime.date, website: str,
-                        summary: str) -> None:
-        """Updates the specified publication entry
 
-        Note about the date: the date is converted to an isoformat string before
-        being stored. This is done because JSONEncoder does not support
-        encoding the datetime type.
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which publication entry is to be updated
-        name - string containing the name of the published work
-        publisher - string containing the name of the publisher
-        release_date - date the publication was released
-        website - string containing the url for the publication's website
-        summary - string containing a description of the published work
-        """
-        self["publications"][index].update({"name": name,
-                                            "publisher": publisher,
-                                            "releaseDate": release_date.isoformat(),
-                                            "website": website,
-                                            "summary": summary})
+        return self
 
+    @data.setter
+    def data(self, value: dict) -> None:
+        self.clear()
+        self.update(value)
 
-    # Skill section
-    def add_skill(self, name: str, level: str, keywords: list) -> None:
-        """Adds a new entry to the skills list
+    categories = ("basics", "work", "volunteer", "education", "awards",
+                  "publications", "skills", "languages", "interests",
+                  "references")
+    
+    # File I/O
+    def open_from_file(self, location: str) -> None:
+        """Fills in the Resume instance using the specified json resume
 
         Returns: None
 
         Arguments:
         ---
-        name - string containing the name of the skill
-        level - string containing the level of proficiency in the skill
-        keywords - list containing keywords relating to the skill
+        location - string containing the url from which to open
         """
 
-        self["skills"].append({"name": name,
-                               "level": level,
-                               "keywords": keywords})
+        fd = os.open(location, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            if (orjson and stat.S_ISREG(st.st_mode)
+                    and st.st_size > _MMAP_THRESHOLD):
+                # orjson parses straight from the mapped pages, without
+                # copying the file into a bytes object first
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        resume = orjson.loads(view)
+            else:
+                # A regular file is read with a single call into a buffer of
+                # its size, followed by one more to confirm the end of the
+                # file. Reading carries on until then, as reads can come back
+                # short
+                raw = os.read(fd, st.st_size or _READ_SIZE)
+                chunks = [raw]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, _READ_SIZE))
+                if len(chunks) > 2:
+                    raw = b''.join(chunks)
+                resume = _loads(raw)
+        finally:
+            os.close(fd)
+
+        self.update(resume)
 
-    def remove_skill(self, index: int) -> None:
-        """Removes the specified skill entry
+        self.location = location
 
-        Returns: None
+    @classmethod
+    def iter_from_file(cls, location: str, batch_size: int=1 << 20):
+        """Yields a Resume for each json resume stored in the specified file
 
-        Arguments:
-        ---
-        index - integer indicating which skill entry is to be removed
-        """
-
-        del self["skills"][index]
+        The file may contain any number of json resumes separated by
+        whitespace, such as a newline-delimited archive. It is read batch_size
+        bytes at a time, so only the resume currently being parsed is held in
+        memory rather than the whole file. A ValueError giving the position in
+        the file is raised as soon as anything other than a valid json object
+        is found.
 
-    def update_skill(self, index: int, name: str, level: str,
-                     keywords: list) -> None:
-        """Updates the specified skill entry
+        Note about the location: the yielded resumes do not have a location
+        set, since saving one of them would overwrite the rest of the file.
 
-        Returns: None
+        Returns: generator of Resume instances
 
         Arguments:
         ---
-        index - integer indicating which skill entry is to be updated
-        name - string containing the name of the skill
-        level - string containing the level of proficiency in the skill
-        keywords - list containing keywords relating to the skill
-        """
-
-        self["skills"][index].update({"name": name,
-                               "level": level,
-                               "keywords": keywords})
+        location - string containing the url from which to open
+        batch_size - optional positive integer number of bytes read at a time
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, not {batch_size}")
+
+        buffer = bytearray()
+        offset = 0      # position of the start of buffer within the file
+        pos = 0         # position in buffer up to which it has been scanned
+        start = 0       # position in buffer of the current resume
+        depth = 0       # nesting depth of objects and arrays at pos
+
+        with open(location, 'rb') as res:
+            while True:
+                batch = res.read(batch_size)
+                buffer += batch
+
+                # Only the new bytes are scanned, tracking nesting until the
+                # current resume's closing brace is found; it is then parsed
+                # once, on its own
+                while True:
+                    if not depth:
+                        match = _NON_WHITESPACE.search(buffer, pos)
+                        if not match:
+                            pos = len(buffer)
+                            break
+                        pos = match.start()
+                        if buffer[pos] != ord('{'):
+                            raise ValueError(
+                                f"{location}: expected a json resume object "
+                                f"at byte {offset + pos}")
+                        start = pos
+                        depth = 1
+                        pos += 1
+                        continue
+
+                    pos = _SKIP.match(buffer, pos).end()
+                    if pos == len(buffer) or buffer[pos] == ord('"'):
+                        # The rest of the resume, or the string it stopped
+                        # at, is in the next batch
+                        break
+
+                    if buffer[pos] in b'{[':
+                        depth += 1
+                    else:
+                        depth -= 1
+                    pos += 1
+
+                    if not depth:
+                        yield cls._from_document(buffer[start:pos], location,
+                                                 offset + start)
+
+                if not batch:
+                    if depth:
+                        raise ValueError(
+                            f"{location}: unexpected end of file in the json "
+                            f"resume starting at byte {offset + start}")
+                    return
+
+                # Discard everything before the current resume
+                keep = start if depth else pos
+                del buffer[:keep]
+                offset += keep
+                pos -= keep
+                start -= keep
+
+    @classmethod
+    def _from_document(cls, document: bytes, location: str, offset: int):
+        """Returns a Resume holding the json resume in document
+
+        Returns: Resume
+
+        Arguments:
+        ---
+        document - bytes containing a single json object
+        location - string containing the url the document was read from
+        offset - integer position of the document within the file
+        """
+
+        try:
+            resume = _loads(document)
+        except ValueError as error:
+            raise ValueError(f"{location}: invalid json resume starting at "
+                             f"byte {offset}: {error}") from error
+
+        instance = cls()
+        instance.update(resume)
+        return instance
 
+    def save(self) -> None:
+        """Writes the Resume instance to a json file
 
-    # Language section
-    def add_language(self, language: str, fluency: str) -> None:
-        """Adds a new entry to the languages list
+        orjson is used for encoding when it is installed, otherwise the
+        standard library's json module is used. The resume is written to a
+        temporary file next to the destination and flushed to disk, and only
+        then replaces it, so an interrupted save or a crash never leaves a
+        partially written resume behind. If the location is a symlink, the
+        file it points to is replaced, and an existing file keeps its
+        permissions.
 
         Returns: None
-
-        Arguments:
-        ---
-        language - string containing the name of the language
-        fluency - string containing the level of fluency in the language
+        Arguments: None
         """
 
-        self["languages"].append({"language": language,
-                                  "fluency": fluency})
+        if not self.location:
+            raise ValueError("the resume has no location to save to")
 
-    def remove_language(self, index: int) -> None:
-        """Removes the specified language entry
-
-        Returns: None
-
-        Arguments:
-        ---
-        index - integer indicating which language entry is to be removed
-        """
-        del self["languages"][index]
+        payload = _dumps(self)
 
-    def update_language(self, index: int, language: str,
-                        fluency: str) -> None:
-        """Updates the specified language entry
+        target = os.path.realpath(self.location)
+        directory, name = os.path.split(target)
+        temporary = os.path.join(directory,
+                                 f"{name}.{os.urandom(8).hex()}.tmp")
+        # The file is created with the mode open() would use, so that the
+        # umask applies to a resume saved for the first time
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                out.write(payload)
+                out.flush()
+                os.fsync(out.fileno())
 
-        Returns: None
+            try:
+                shutil.copymode(target, temporary)
+            except FileNotFoundError:
+                pass
 
-        Arguments:
-        ---
-        index - integer indicating which language entry is to be updated
-        language - string containing the name of the language
-        fluency - string containing the level of fluency in the language
-        """
+            os.replace(temporary, target)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
 
-        self["languages"][index].update({"language": language,
-                                         "fluency": fluency})
 
+    # Basics section
+    def update_basics(self, name: str, label: str, picture: str, email: str,
+                      phone: str, website: str, summary: str) -> None:
+        """Updates the basic information
 
-    # Interest section
-    def add_interest(self, name: str, keywords: list) -> None:
-        """Adds a new entry to the interests list
+        Updates all of the resume's basic information, with the exception of 
+        location and social media profiles
 
         Returns: None
 
         Arguments:
         ---
-        name - string containing the name of the interest
-        keywords - list containing keywords relating to the interest
+        name - string containing the applicant's name
+        label - string containing the applicant's title
+        picture string containing the location of the applicant's photo
+        email - string containing the applicant's email address
+        phone - string containing the applicant's phone number
+        website - string containing the url of the applicant's website
+        summary - string containing a description of the applicant
         """
 
-        self["interests"].append({"name": name,
-                                  "keywords": keywords})
+        basics = self["basics"]
+        basics["name"] = name
+        basics["label"] = label
+        basics["picture"] = picture
+        basics["email"] = email
+        basics["phone"] = phone
+        basics["website"] = website
+        basics["summary"] = summary
 
-    def remove_interest(self, index: int) -> None:
-        """Removes the specified interest entry
+    def update_location(self, address: str, postal_code: str, city: str,
+                        country_code: str, region: str) -> None:
+        """Updates the location information
 
         Returns: None
 
         Arguments:
         ---
-        index - integer indicating which interest entry is to be removed
+        address - string containing the street address
+        postal_code - string containing the postal/zip code
+        city - string containing the city name
+        country_code - string containing the country code (ex: 'US')
+        region - string containing the name of the region or state
         """
 
-        del self["interests"][index]
-
-    def update_interest(self, index: int, name: str, keywords: list) -> None:
-        """Updates the specified interest entry
+        location = self["basics"]["location"]
+        location["address"] = address
+        location["postalCode"] = postal_code
+        location["city"] = city
+        location["countryCode"] = _intern(country_code)
+        location["region"] = region
 
-        Returns: None
 
-        Arguments:
-        ---
-        index - integer indicating which interest entry is to be updated
-        name - string containing the name of the interest
-        keywords - list containing keywords relating to the interest
-        """
+    # Work section
+    def add_work_bulk(self, rows) -> None:
+        """Adds a new entry to the work list for each row of rows
+
+        Each row holds the arguments of add_work in the same order, with None
+        given for an omitted end_date. The entries are all built before any
+        is added, so a malformed row leaves the work list unchanged, and are
+        then added with a single call instead of one add_work call per row.
+
+        Note about the dates: dates are stored as given and are only converted
+        to isoformat strings when the resume is saved. Isoformat strings are
+        also accepted.
+
+        Returns: None
+
+        Arguments:
+        ---
+        rows - iterable of tuples, each containing the arguments for an entry
+        """
+
+        entries = [{"company": company,
+                    "position": position,
+                    "website": website,
+                    "startDate": start_date,
+                    "endDate": end_date,
+                    "summary": summary,
+                    "highlights": highlights}
+                   for (company, position, website, summary, highlights,
+                        start_date, end_date) in rows]
+
+        self["work"].extend(entries)
+
+
+# List sections
+#
+# Every section holding a list of entries gets add_<name>, remove_<name> and
+# update_<name> methods, which are generated from the table below instead of
+# being written out by hand. Each section gives the path to its list within
+# the resume and its fields in the order the methods take them, and may give
+# the order in which the keys are stored when that differs. Fields taking one
+# of a few recurring values are interned.
+
+_Field = collections.namedtuple(
+    "_Field", "param key annotation description optional interned",
+    defaults=(False, False))
+_Section = collections.namedtuple("_Section", "path fields key_order",
+                                  defaults=(None,))
+
+_LIST_SECTIONS = {
+    "profile": _Section(("basics", "profiles"), (
+        _Field("network", "network", "str",
+               "string containing the name of the social network"),
+        _Field("username", "username", "str",
+               "string containing the username"),
+        _Field("url", "url", "str",
+               "string containing the network's url"))),
+    "work": _Section(("work",), (
+        _Field("company", "company", "str",
+               "string containing the name of the company worked for"),
+        _Field("position", "position", "str",
+               "string containing the title of the position worked"),
+        _Field("website", "website", "str",
+               "string containing the url of the company's website"),
+        _Field("summary", "summary", "str",
+               "string containing a summary of the position"),
+        _Field("highlights", "highlights", "list",
+               "list containing highlighted points from the position"),
+        _Field("start_date", "startDate", "datetime.date",
+               "date that the position began"),
+        _Field("end_date", "endDate", "datetime.date",
+               "optional date that the position ended", True)),
+        ("company", "position", "website", "startDate", "endDate", "summary",
+         "highlights")),
+    "volunteer": _Section(("volunteer",), (
+        _Field("organization", "organization", "str",
+               "string containing the name of the organization"),
+        _Field("position", "position", "str",
+               "string containing the name of the volunteer position"),
+        _Field("website", "website", "str",
+               "string containing the url of the organization"),
+        _Field("summary", "summary", "str",
+               "string containing a summary of the volunteer work"),
+        _Field("highlights", "highlights", "list",
+               "list containing highlighted points from the position"),
+        _Field("start_date", "startDate", "datetime.date",
+               "date the volunteer work began"),
+        _Field("end_date", "endDate", "datetime.date",
+               "optional date the volunteer work ended", True)),
+        ("organization", "position", "website", "startDate", "endDate",
+         "summary", "highlights")),
+    "education": _Section(("education",), (
+        _Field("institution", "institution", "str",
+               "string containing the name of the institution attended"),
+        _Field("area", "area", "str",
+               "string containing the area studied"),
+        _Field("study_type", "studyType", "str",
+               "string containing the level at which the area was studied"),
+        _Field("gpa", "gpa", "str",
+               "string containing the current or graduating gpa"),
+        _Field("courses", "courses", "list",
+               "list containing relevant courses taken"),
+        _Field("start_date", "startDate", "datetime.date",
+               "date the education began"),
+        _Field("end_date", "endDate", "datetime.date",
+               "optional date the education was completed", True)),
+        ("institution", "area", "studyType", "gpa", "startDate", "endDate",
+         "courses")),
+    "award": _Section(("awards",), (
+        _Field("title", "title", "str",
+               "string containing the title of the award"),
+        _Field("date", "date", "datetime.date",
+               "date the award was received"),
+        _Field("awarder", "awarder", "str",
+               "string containing the giver of the award"),
+        _Field("summary", "summary", "str",
+               "string containing a description of the award"))),
+    "publication": _Section(("publications",), (
+        _Field("name", "name", "str",
+               "string containing the name of the published work"),
+        _Field("publisher", "publisher", "str",
+               "string containing the name of the publisher"),
+        _Field("release_date", "releaseDate", "datetime.date",
+               "date the publication was released"),
+        _Field("website", "website", "str",
+               "string containing the url for the publication's website"),
+        _Field("summary", "summary", "str",
+               "string containing a description of the published work"))),
+    "skill": _Section(("skills",), (
+        _Field("name", "name", "str",
+               "string containing the name of the skill"),
+        _Field("level", "level", "str",
+               "string containing the level of proficiency in the skill",
+               interned=True),
+        _Field("keywords", "keywords", "list",
+               "list containing keywords relating to the skill"))),
+    "language": _Section(("languages",), (
+        _Field("language", "language", "str",
+               "string containing the name of the language"),
+        _Field("fluency", "fluency", "str",
+               "string containing the level of fluency in the language",
+               interned=True))),
+    "interest": _Section(("interests",), (
+        _Field("name", "name", "str",
+               "string containing the name of the interest"),
+        _Field("keywords", "keywords", "list",
+               "list containing keywords relating to the interest"))),
+    "reference": _Section(("references",), (
+        _Field("name", "name", "str",
+               "string containing the name of the reference"),
+        _Field("reference", "reference", "str",
+               "string containing a statement from the reference"))),
+}
+
+_DATES_NOTE = """
+Note about the dates: dates are stored as given and are only converted to
+isoformat strings when the resume is saved, so entries read from a file
+hold strings while entries added since hold date objects. Isoformat strings
+are also accepted.
+"""
 
-        self["interests"][index].update({"name": name,
-                                         "keywords": keywords})
+_DATE_NOTE = """
+Note about the date: the date is stored as given and is only converted to
+an isoformat string when the resume is saved, so entries read from a file
+hold strings while entries added since hold date objects. Isoformat strings
+are also accepted.
+"""
 
 
-    # Reference section
-    def add_reference(self, name: str, reference: str) -> None:
-        """Adds a new entry to the reference list
+def _field_value(field: _Field) -> str:
+    """Returns the source of the expression storing field's parameter"""
 
-        Returns: None
+    if field.interned:
+        return f"_intern({field.param})"
+    return field.param
 
-        Arguments:
-        ---
-        name - string containing the name of the reference
-        reference - string containing a statement from the reference
-        """
 
-        self["references"].append({"name": name,
-                                   "reference": reference})
+def _section_docstring(verb: str, name: str, section: _Section) -> str:
+    """Returns the docstring of the verb_name method of section"""
 
-    def remove_reference(self, index: int) -> None:
-        """Removes the specified reference entry
+    if verb == "add":
+        lines = [f"Adds a new entry to the {section.path[-1]} list"]
+    elif verb == "remove":
+        lines = [f"Removes the specified {name} entry"]
+    else:
+        lines = [f"Updates the specified {name} entry"]
 
-        Returns: None
+    dates = sum(f.annotation == "datetime.date" for f in section.fields)
+    if verb != "remove" and dates:
+        lines.append(_DATES_NOTE if dates > 1 else _DATE_NOTE)
+    else:
+        lines.append("")
 
-        Arguments:
-        ---
-        index - integer indicating which reference entry is to be removed
-        """
+    lines += ["Returns: None", "", "Arguments:", "---"]
+    if verb != "add":
+        lines.append(f"index - integer indicating which {name} entry is to be "
+                     f"{verb}d")
+    if verb != "remove":
+        lines += [f"{f.param} - {f.description}" for f in section.fields]
 
-        del self["references"][index]
+    return "\n".join(lines)
 
-    def update_reference(self, index: int, name: str, reference: str) -> None:
-        """Adds a new entry to the reference list
 
-        Returns: None
+def _generate_list_methods(cls: type) -> None:
+    """Attaches the add, remove and update methods of each list section to cls
 
-        Arguments:
-        ---
-        index - integer indicating which reference entry is to be updated
-        name - string containing the name of the reference
-        reference - string containing a statement from the reference
-        """
+    The methods are specialized per section: each is a single dict literal,
+    del statement or run of item assignments on the section's list.
+    """
 
-        self["references"][index].update({"name": name,
-                                          "reference": reference})
\ No newline at end of file
+    namespace = {"__name__": __name__, "datetime": datetime,
+                 "_intern": _intern}
+
+    for name, section in _LIST_SECTIONS.items():
+        target = "self" + "".join(f"[{key!r}]" for key in section.path)
+        params = ", ".join(
+            f"{f.param}: {f.annotation}" + ("=None" if f.optional else "")
+            for f in section.fields)
+
+        fields = {f.key: f for f in section.fields}
+        keys = section.key_order or fields
+        entry = ", ".join(f"{key!r}: {_field_value(fields[key])}"
+                          for key in keys)
+        assignments = "".join(
+            f"    entry[{key!r}] = {_field_value(fields[key])}\n"
+            for key in keys)
+
+        exec(f"def add_{name}(self, {params}) -> None:\n"
+             f"    {target}.append({{{entry}}})\n"
+             f"\n"
+             f"def remove_{name}(self, index: int) -> None:\n"
+             f"    del {target}[index]\n"
+             f"\n"
+             f"def update_{name}(self, index: int, {params}) -> None:\n"
+             f"    entry = {target}[index]\n"
+             f"{assignments}",
+             namespace)
+
+        for verb in ("add", "remove", "update"):
+            method = namespace.pop(f"{verb}_{name}")
+            method.__qualname__ = f"{cls.__name__}.{method.__name__}"
+            method.__doc__ = _section_docstring(verb, name, section)
+            setattr(cls, method.__name__, method)
+
+
+_generate_list_methods(Resume)
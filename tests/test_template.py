@@ -0,0 +1,73 @@
+"""Tests for the template module"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import template
+
+
+class IterFromFileTest(unittest.TestCase):
+    """Tests for Resume.iter_from_file"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.location = os.path.join(directory.name, "resumes.json")
+
+    def write(self, content: str) -> None:
+        with open(self.location, "w", encoding="utf-8") as out:
+            out.write(content)
+
+    def test_yields_each_resume_for_any_batch_size(self):
+        resumes = [{"basics": {"name": f"n{i} é \\\" {{[}}] \\\\",
+                               "summary": "☃" * i},
+                    "work": [{"highlights": [[], {}, "]}"]}] * i}
+                   for i in range(5)]
+        self.write("\n".join(json.dumps(resume, ensure_ascii=i % 2 == 0)
+                             for i, resume in enumerate(resumes)) + "\n")
+
+        for batch_size in (1, 2, 3, 7, 64, 1 << 20):
+            found = template.Resume.iter_from_file(self.location, batch_size)
+            self.assertEqual([dict(resume) for resume in found],
+                             [dict(template.Resume(), **resume)
+                              for resume in resumes], batch_size)
+
+    def test_empty_file_yields_nothing(self):
+        self.write(" \n\t ")
+        self.assertEqual(list(template.Resume.iter_from_file(self.location)),
+                         [])
+
+    def test_malformed_resume_is_reported_before_the_rest_is_read(self):
+        self.write('{"basics": {}} {"work": x} ' + "{" * 100000)
+        found = template.Resume.iter_from_file(self.location, 4)
+
+        self.assertEqual(next(found)["basics"], {})
+        with self.assertRaisesRegex(ValueError, "starting at byte 15"):
+            next(found)
+
+    def test_non_object_is_rejected(self):
+        for content in ('[{"basics": {}}]', '{"basics": {}}}', '  "resume"'):
+            self.write(content)
+            with self.assertRaisesRegex(ValueError, "expected a json resume"):
+                list(template.Resume.iter_from_file(self.location, 2))
+
+    def test_truncated_resume_is_rejected(self):
+        self.write('{"basics": {"name": "a\\')
+        with self.assertRaisesRegex(ValueError, "unexpected end of file"):
+            list(template.Resume.iter_from_file(self.location, 3))
+
+    def test_batch_size_must_be_positive(self):
+        self.write('{"basics": {}}')
+        for batch_size in (0, -1):
+            with self.assertRaises(ValueError):
+                list(template.Resume.iter_from_file(self.location,
+                                                    batch_size))
+
+
+if __name__ == "__main__":
+    unittest.main()